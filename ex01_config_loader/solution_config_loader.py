@@ -1,18 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
-import json
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json also parses bytes
+    import json as _json
+
+
+_REQUIRED_KEYS = ("app_name", "environment", "log_level", "retry_count")
+_ALLOWED_ENVS = frozenset({"dev", "test", "prod"})
+_ALLOWED_LEVELS = frozenset({"DEBUG", "INFO", "WARN", "WARNING", "ERROR", "CRITICAL"})
 
 
 class ConfigError(Exception):
     """Raised when the configuration file is invalid or missing required values."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
-    """Application configuration settings."""
+    """Application configuration settings (immutable, so it can be cached)."""
     app_name: str
     environment: str
     log_level: str
@@ -24,11 +34,11 @@ def read_json_file(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise ConfigError(f"Config file not found: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError as exc:
-            raise ConfigError(f"Config file is not valid JSON: {path}") from exc
+    try:
+        return _json.loads(path.read_bytes())
+    except ValueError as exc:
+        # Covers json/orjson JSONDecodeError as well as invalid UTF-8
+        raise ConfigError(f"Config file is not valid JSON: {path}") from exc
 
 
 def validate_raw_config(raw: Dict[str, Any]) -> None:
@@ -36,8 +46,7 @@ def validate_raw_config(raw: Dict[str, Any]) -> None:
     Validate that the raw config contains required fields
     and that values are of the expected type.
     """
-    required_keys = ["app_name", "environment", "log_level", "retry_count"]
-    missing = [k for k in required_keys if k not in raw]
+    missing = [k for k in _REQUIRED_KEYS if k not in raw]
     if missing:
         missing_str = ", ".join(missing)
         raise ConfigError(f"Missing required config keys: {missing_str}")
@@ -52,19 +61,17 @@ def validate_raw_config(raw: Dict[str, Any]) -> None:
         raise ConfigError("retry_count must be >= 0")
 
     # Optional: validate environment
-    allowed_envs = {"dev", "test", "prod"}
     env = str(raw["environment"]).lower()
-    if env not in allowed_envs:
+    if env not in _ALLOWED_ENVS:
         raise ConfigError(
-            f"environment must be one of {sorted(allowed_envs)}, got {raw['environment']!r}"
+            f"environment must be one of {sorted(_ALLOWED_ENVS)}, got {raw['environment']!r}"
         )
 
     # Optional: validate log_level
-    allowed_levels = {"DEBUG", "INFO", "WARN", "WARNING", "ERROR", "CRITICAL"}
     log_level = str(raw["log_level"]).upper()
-    if log_level not in allowed_levels:
+    if log_level not in _ALLOWED_LEVELS:
         raise ConfigError(
-            f"log_level must be one of {sorted(allowed_levels)}, got {raw['log_level']!r}"
+            f"log_level must be one of {sorted(_ALLOWED_LEVELS)}, got {raw['log_level']!r}"
         )
 
 
@@ -82,15 +89,46 @@ def parse_config(raw: Dict[str, Any]) -> AppConfig:
     )
 
 
-def load_config(path: Path) -> AppConfig:
+@lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
     """
-    High-level API: load and validate config from a JSON file.
+    Read, validate and parse a config file.
+
+    mtime_ns and size are only part of the cache key: when the file changes,
+    the new modification time misses the cache and the file is loaded again.
+    The size catches rewrites within one mtime tick on filesystems with
+    coarse timestamps.
     """
-    raw = read_json_file(path)
+    raw = read_json_file(Path(path_str))
     validate_raw_config(raw)
     return parse_config(raw)
 
 
+def load_config(path: Path) -> AppConfig:
+    """
+    High-level API: load and validate config from a JSON file.
+
+    Results are cached per file (by resolved path, so relative paths and
+    symlinks share an entry), modification time and size, so repeated calls
+    for an unchanged file skip reading and validating it again.
+    """
+    try:
+        resolved = path.resolve(strict=True)
+        stat = resolved.stat()
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Config file not found: {path}") from exc
+
+    try:
+        return _load_config_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
+    except ConfigError:
+        # Failures are never cached, and this is the rare path: load once
+        # more from the path as given so the error names the file the way
+        # the caller did, not by its resolved absolute path.
+        raw = read_json_file(path)
+        validate_raw_config(raw)
+        return parse_config(raw)
+
+
 def main() -> None:
     """
     Simple manual test:
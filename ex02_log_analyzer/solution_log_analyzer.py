@@ -1,11 +1,52 @@
 from __future__ import annotations
 
+import heapq
+import mmap
+import re
+import sys
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
-
-
-@dataclass(frozen=True)
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# "[LEVEL] message": whitespace around the brackets is ignored, and the
+# first ']' closes the level.
+_LINE_RE = re.compile(r"\s*\[\s*([^\]]*?)\s*\]\s*(.*?)\s*", re.DOTALL)
+
+# Bytes counterpart that finds every valid line in a whole log buffer and
+# captures just its level. The class is the ASCII whitespace str.strip()
+# removes, minus "\n" (\x1c-\x1f count as whitespace for str but not for a
+# bytes \s), so a match never runs across lines, and it stops at the first
+# message char.
+_LEVEL_LINE_RE = re.compile(
+    rb"^[ \t\r\x0b\x0c\x1c-\x1f]*\[[ \t\r\x0b\x0c\x1c-\x1f]*([^\]\n]*?)"
+    rb"[ \t\r\x0b\x0c\x1c-\x1f]*\][ \t\r\x0b\x0c\x1c-\x1f]*[^\s\x1c-\x1f]",
+    re.MULTILINE,
+)
+
+# A "\r" not followed by "\n": a line break in text mode, but plain
+# whitespace to _LEVEL_LINE_RE
+_BARE_CR_RE = re.compile(rb"\r(?!\n)")
+
+# Everything _LEVEL_LINE_RE would read differently from parse_log_line:
+# a lone "\r", plus the UTF-8 encodings of the non-ASCII characters that
+# str.strip() treats as whitespace (U+0085, U+00A0, U+1680, U+2000-U+200A,
+# U+2028, U+2029, U+202F, U+205F, U+3000)
+_NEEDS_TEXT_PATH_RE = re.compile(
+    rb"\r(?!\n)|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]"
+    rb"|\xe2\x81\x9f|\xe3\x80\x80"
+)
+
+# Read logs in 1 MiB chunks instead of the default 8 KiB to cut down on
+# read() system calls for large files.
+_READ_BUFFER_SIZE = 1 << 20
+
+# Logs up to this size are read into memory in one go; larger ones are
+# scanned through mmap instead.
+_READ_ALL_LIMIT = 64 << 20
+
+
+@dataclass(frozen=True, slots=True)
 class LogEntry:
     """Represents a single parsed log entry."""
     level: str
@@ -14,7 +55,7 @@ class LogEntry:
 
 def read_log_lines(path: Path) -> List[str]:
     """Read all lines from a log file."""
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
         return [line.rstrip("\n") for line in f]
 
 
@@ -28,27 +69,37 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
 
     Returns None if the line does not match the expected format.
     """
-    line = line.strip()
-    if not line:
+    match = _LINE_RE.fullmatch(line)
+    if match is None:
         return None
 
-    if not (line.startswith("[") and "]" in line):
+    level, message = match.groups()
+    if not level or not message:
         return None
 
-    try:
-        closing_bracket_index = line.index("]")
-    except ValueError:
-        return None
+    # There are only a handful of distinct levels: share one str per level
+    level = sys.intern(level)
 
-    level = line[1:closing_bracket_index].strip()
-    # Everything after '] ' is the message
-    remainder = line[closing_bracket_index + 1 :].lstrip()
-    message = remainder
+    return LogEntry(level=level, message=message)
 
-    if not level or not message:
-        return None
 
-    return LogEntry(level=level, message=message)
+def iter_log_entries(path: Path) -> Iterator[LogEntry]:
+    """
+    Lazily parse a log file, yielding a LogEntry for each valid line.
+
+    Unlike read_log_lines, lines are read and parsed one at a time, so
+    memory use stays flat however large the file is, e.g.:
+      count_by_level(iter_log_entries(path))
+    """
+    with path.open("r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+        for line in f:
+            # Cheap substring check first: blank lines, continuation lines
+            # etc. never reach the regex
+            if "[" not in line:
+                continue
+            entry = parse_log_line(line)
+            if entry is not None:
+                yield entry
 
 
 def count_by_level(entries: Iterable[LogEntry]) -> Dict[str, int]:
@@ -58,41 +109,84 @@ def count_by_level(entries: Iterable[LogEntry]) -> Dict[str, int]:
     Example output:
       {"INFO": 10, "ERROR": 3}
     """
-    counts: Dict[str, int] = {}
-    for entry in entries:
-        counts[entry.level] = counts.get(entry.level, 0) + 1
-    return counts
+    return Counter(entry.level for entry in entries)
 
 
 def top_n_levels(counts: Dict[str, int], n: int) -> Dict[str, int]:
     """
     Return the top N log levels by frequency.
     """
-    # Sort by frequency descending, then by name for stability
-    sorted_items = sorted(
+    # Order by frequency descending, then by name for stability.
+    # nsmallest only keeps n items around instead of sorting everything.
+    top_items = heapq.nsmallest(
+        n,
         counts.items(),
         key=lambda kv: (-kv[1], kv[0]),
     )
-    top_items = sorted_items[:n]
     return dict(top_items)
 
 
+def _decode_level_counts(counts: Counter[bytes]) -> Counter[str]:
+    """Turn the byte-level counts of _LEVEL_LINE_RE into str-level counts."""
+    # "[ ] message" matches with an empty level, which is not a valid entry
+    counts.pop(b"", None)
+    return Counter({level.decode("utf-8"): count for level, count in counts.items()})
+
+
+def _count_levels(path: Path) -> Counter[str]:
+    """
+    Count log levels per valid line, like count_by_level(iter_log_entries(path)).
+
+    Usually the whole file is scanned by _LEVEL_LINE_RE inside the regex
+    engine, so no str or LogEntry objects are created per line. Files the
+    byte scan would misread (see _NEEDS_TEXT_PATH_RE) go through the exact
+    line-by-line parser instead, so the result never depends on the path.
+    """
+    size = path.stat().st_size
+    # Nothing to count, and mmap refuses to map an empty file
+    if size == 0:
+        return Counter()
+
+    if size <= _READ_ALL_LIMIT:
+        data = path.read_bytes()
+        # isascii() is a quick C check; pure ASCII can only trip on a lone "\r"
+        check = _BARE_CR_RE if data.isascii() else _NEEDS_TEXT_PATH_RE
+        if check.search(data) is None:
+            # findall does the scan in one C call and returns only the levels
+            return _decode_level_counts(Counter(_LEVEL_LINE_RE.findall(data)))
+    else:
+        with path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The file is read front to back: ask for aggressive read-ahead
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if _NEEDS_TEXT_PATH_RE.search(mm) is None:
+                    return _decode_level_counts(
+                        Counter(match[1] for match in _LEVEL_LINE_RE.finditer(mm))
+                    )
+
+    return Counter(count_by_level(iter_log_entries(path)))
+
+
 def analyze_log(path: Path, n: int = 3) -> Dict[str, int]:
     """
     High-level helper that:
-      - Reads the log file
-      - Parses each line into LogEntry objects (skipping invalid lines)
+      - Scans the log file for valid log lines (skipping invalid lines)
       - Counts entries per level
       - Returns the top N levels by frequency
     """
-    lines = read_log_lines(path)
-    entries = [
-        entry
-        for line in lines
-        if (entry := parse_log_line(line)) is not None
-    ]
-    counts = count_by_level(entries)
-    return top_n_levels(counts, n)
+    return analyze_logs([path], n)
+
+
+def analyze_logs(paths: Iterable[Path], n: int = 3) -> Dict[str, int]:
+    """
+    Like analyze_log, but combines the counts of several log files
+    (e.g. a set of rotated logs) before picking the top N levels.
+    """
+    level_counts: Counter[str] = Counter()
+    for path in paths:
+        level_counts.update(_count_levels(path))
+    return top_n_levels(level_counts, n)
 
 
 def main() -> None:
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import solution_log_analyzer
+from solution_log_analyzer import (
+    analyze_log,
+    count_by_level,
+    iter_log_entries,
+    top_n_levels,
+)
+
+
+LOGS = {
+    "plain": "[INFO] started\n[ERROR] failed\n\n  [ INFO ]  again  \nno level\n",
+    "crlf": "[INFO] started\r\n[WARN] careful\r\n[INFO] done\r\n",
+    "nbsp": "\u00a0[INFO] indented\n[WARN]\u00a0\u00a0\n[ERROR\u00a0] x\n[\u3000] y\n",
+    "lone_cr": "[INFO] a\r[WARN] b\r\n[ERROR]\r x\r",
+    "separators": "\x1c[INFO\x1d] a\n[WARN] \x1f\n[\x1e] b\n",
+    "mixed": "\u00a0[INFO] indented\n[WARN]\u00a0 \n[ERROR] x\rold mac line\n",
+    "empty": "",
+}
+
+
+def _expected(path: Path, n: int) -> dict[str, int]:
+    return top_n_levels(count_by_level(iter_log_entries(path)), n)
+
+
+@pytest.mark.parametrize("read_all_limit", [64 << 20, 0], ids=["read_all", "mmap"])
+@pytest.mark.parametrize("name", sorted(LOGS))
+def test_analyze_log_matches_line_parser(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    name: str,
+    read_all_limit: int,
+) -> None:
+    """analyze_log should count like the line-by-line helpers on both size paths."""
+    monkeypatch.setattr(solution_log_analyzer, "_READ_ALL_LIMIT", read_all_limit)
+    path = tmp_path / f"{name}.log"
+    path.write_bytes(LOGS[name].encode("utf-8"))
+    assert analyze_log(path, n=10) == _expected(path, 10)
@@ -1,8 +1,28 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+import re
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Fastest parser available for response bodies: orjson, then ujson, then
+# the stdlib. Each takes bytes and raises a ValueError subclass on bad JSON.
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
 
 
 class ApiClientError(Exception):
@@ -16,15 +36,168 @@ class WeatherInfo:
     summary: str
 
 
+# -------------------- Shared HTTP plumbing --------------------
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a pooled HTTP session.
+
+    Connections are kept alive and reused between calls, and transient
+    failures (429/5xx) are retried with a small backoff.
+    """
+    session = requests.Session()
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        # Hand the last response back so callers can report its status code
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _client_session(
+    session: Optional[requests.Session],
+    user_agent: str,
+) -> Tuple[requests.Session, Optional[Dict[str, str]]]:
+    """
+    Return the session a client should use and the headers to send per request.
+
+    A session built here gets the headers once. A caller's session is left
+    untouched (it may be shared by clients with different User-Agents), so
+    the headers are sent with every request instead.
+    """
+    headers = {"User-Agent": user_agent, "Accept": "application/json"}
+    if session is None:
+        session = _build_session()
+        session.headers.update(headers)
+        return session, None
+    return session, headers
+
+
+class _TTLCache:
+    """
+    Small thread-safe in-memory LRU cache whose entries expire after a TTL.
+
+    When full, the least recently used entry is evicted. Expired entries
+    are kept until they are overwritten or evicted, so callers can still
+    revalidate them (e.g. with If-Modified-Since).
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, *, include_expired: bool = False) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        expires_at, value = entry
+        if not include_expired and expires_at <= time.monotonic():
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store value under key for ttl_seconds (defaults to the cache TTL)."""
+        if ttl_seconds is None:
+            ttl_seconds = self._ttl_seconds
+        expires_at = time.monotonic() + ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+def _body_snippet(response: requests.Response, limit: int = 512) -> str:
+    """
+    Return the start of a response body for error messages.
+
+    Only the first `limit` bytes are decoded (as UTF-8, replacing invalid
+    sequences), so a huge error page never goes through charset detection
+    and a full decode via response.text.
+    """
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+def _seconds_until_expires(response: requests.Response, default: float) -> float:
+    """Return how long a response stays fresh according to its Expires header."""
+    expires = response.headers.get("Expires")
+    if not expires:
+        return default
+
+    try:
+        expires_at = parsedate_to_datetime(expires)
+    except (TypeError, ValueError):
+        return default
+
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds())
+
+
 # -------------------- Weather (MET Norway) client --------------------
 
 
+_SYMBOL_TEXT: Dict[str, str] = {
+    "clearsky_day": "Clear sky",
+    "clearsky_night": "Clear sky",
+    "cloudy": "Cloudy",
+    "fair_day": "Fair",
+    "fair_night": "Fair",
+    "partlycloudy_day": "Partly cloudy",
+    "partlycloudy_night": "Partly cloudy",
+    "rain": "Rain",
+    "heavyrain": "Heavy rain",
+    "lightrain": "Light rain",
+    "snow": "Snow",
+    "heavysnow": "Heavy snow",
+    "lightsnow": "Light snow",
+    "fog": "Fog",
+}
+
+# Day/night variant suffix of a MET symbol_code, e.g. "rainshowers_day"
+_SYMBOL_VARIANT_RE = re.compile(r"_(?:day|night)$")
+
+# Forecast periods checked for a summary, shortest first
+_SUMMARY_PERIODS = ("next_1_hours", "next_6_hours", "next_12_hours")
+
+
+@dataclass(frozen=True)
+class _Forecast:
+    """Cached part of a MET response; the label is added per call."""
+    temperature_c: float
+    summary: str
+    last_modified: Optional[str]
+
+
 class WeatherClient:
     """
     HTTP client for MET Norway's Weather API (Locationforecast/2.0).
 
     Docs:
       - https://api.met.no/weatherapi/locationforecast/2.0/documentation
+
+    Forecasts are cached per coordinate until the Expires time MET sends
+    (or cache_ttl_seconds when it is missing). Stale entries are
+    revalidated with If-Modified-Since, as the MET terms of service ask.
+
+    Pass `session` to share one requests.Session (and its connection pool)
+    with other clients; it is then left open by close(), and its headers are
+    not modified (User-Agent/Accept are sent with each request instead).
     """
 
     def __init__(
@@ -32,51 +205,50 @@ class WeatherClient:
         base_url: str = "https://api.met.no/weatherapi/locationforecast/2.0",
         timeout_seconds: float = 5.0,
         user_agent: str = "my-weather-app/0.1 you@example.com",
+        cache_ttl_seconds: float = 3600.0,
+        session: Optional[requests.Session] = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
+        self._forecast_url = f"{self._base_url}/compact"
         self._timeout_seconds = timeout_seconds
-        self._user_agent = user_agent
+        self._owns_session = session is None
+        self._session, self._request_headers = _client_session(session, user_agent)
+        self._cache = _TTLCache(cache_ttl_seconds)
+        self._cache_ttl_seconds = cache_ttl_seconds
+
+    def close(self) -> None:
+        """Close the HTTP session, unless it was passed in by the caller."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> WeatherClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         if not response.ok:
             raise ApiClientError(
-                f"Unexpected status code {response.status_code}: {response.text}"
+                f"Unexpected status code {response.status_code}: {_body_snippet(response)}"
             )
 
+        # Parse the raw bytes directly; response.json() would first decode
+        # the body to str (with charset detection) before parsing it.
         try:
-            return response.json()
+            return _json.loads(response.content)
         except ValueError as exc:
             raise ApiClientError("Response body is not valid JSON") from exc
 
     @staticmethod
+    @lru_cache(maxsize=256)  # MET has a small, fixed set of symbol codes
     def _symbol_to_text(symbol_code: str) -> str:
-        mapping = {
-            "clearsky_day": "Clear sky",
-            "clearsky_night": "Clear sky",
-            "cloudy": "Cloudy",
-            "fair_day": "Fair",
-            "fair_night": "Fair",
-            "partlycloudy_day": "Partly cloudy",
-            "partlycloudy_night": "Partly cloudy",
-            "rain": "Rain",
-            "heavyrain": "Heavy rain",
-            "lightrain": "Light rain",
-            "snow": "Snow",
-            "heavysnow": "Heavy snow",
-            "lightsnow": "Light snow",
-            "fog": "Fog",
-        }
-
-        if symbol_code in mapping:
-            return mapping[symbol_code]
+        text = _SYMBOL_TEXT.get(symbol_code)
+        if text is not None:
+            return text
 
         # fallback: prettify arbitrary symbol_code
-        return (
-            symbol_code.replace("_day", "")
-            .replace("_night", "")
-            .replace("_", " ")
-            .capitalize()
-        )
+        return _SYMBOL_VARIANT_RE.sub("", symbol_code).replace("_", " ").capitalize()
 
     def get_weather_for_coordinates(
         self,
@@ -89,22 +261,37 @@ class WeatherClient:
         """
         Retrieve current-ish weather info for coordinates using MET Locationforecast.
         """
-        lat_rounded = round(lat, 4)
-        lon_rounded = round(lon, 4)
+        # MET wants at most 4 decimals; the strings double as the cache key
+        lat_text = f"{lat:.4f}"
+        lon_text = f"{lon:.4f}"
 
-        url = f"{self._base_url}/compact"
-        params: Dict[str, Any] = {"lat": lat_rounded, "lon": lon_rounded}
+        params: Dict[str, Any] = {"lat": lat_text, "lon": lon_text}
         if altitude is not None:
             params["altitude"] = round(altitude)
 
-        headers = {
-            "User-Agent": self._user_agent,
-            "Accept": "application/json",
-        }
+        key = (lat_text, lon_text, params.get("altitude"))
+        forecast = self._cache.get(key)
+        if forecast is None:
+            forecast = self._fetch_forecast(key, params)
+
+        city_label = label or f"({lat_text}, {lon_text})"
+
+        return WeatherInfo(
+            city=city_label,
+            temperature_c=forecast.temperature_c,
+            summary=forecast.summary,
+        )
+
+    def _fetch_forecast(self, key: Hashable, params: Dict[str, Any]) -> _Forecast:
+        """Download (or revalidate) the forecast for params and cache it."""
+        stale: Optional[_Forecast] = self._cache.get(key, include_expired=True)
+        headers = self._request_headers
+        if stale is not None and stale.last_modified:
+            headers = {**(headers or {}), "If-Modified-Since": stale.last_modified}
 
         try:
-            response = requests.get(
-                url,
+            response = self._session.get(
+                self._forecast_url,
                 params=params,
                 headers=headers,
                 timeout=self._timeout_seconds,
@@ -112,6 +299,13 @@ class WeatherClient:
         except requests.RequestException as exc:
             raise ApiClientError(f"HTTP request failed: {exc}") from exc
 
+        ttl_seconds = _seconds_until_expires(response, self._cache_ttl_seconds)
+
+        if response.status_code == 304 and stale is not None:
+            # Not modified: keep the cached forecast for another period
+            self._cache.set(key, stale, ttl_seconds)
+            return stale
+
         data = self._handle_response(response)
 
         try:
@@ -120,8 +314,8 @@ class WeatherClient:
             if not timeseries:
                 raise ApiClientError("No timeseries data in MET response")
 
-            first_ts = timeseries[0]
-            details = first_ts["data"]["instant"]["details"]
+            data_block = timeseries[0]["data"]
+            details = data_block["instant"]["details"]
             temp_c = float(details["air_temperature"])
         except KeyError as exc:
             raise ApiClientError(f"Missing expected key in MET response: {exc}") from exc
@@ -130,43 +324,66 @@ class WeatherClient:
 
         summary_text = "No summary available"
         try:
-            data_block = first_ts["data"]
-            for key in ("next_1_hours", "next_6_hours", "next_12_hours"):
-                block = data_block.get(key)
+            for period in _SUMMARY_PERIODS:
+                block = data_block.get(period)
                 if not block:
                     continue
-                summary = block.get("summary")
-                if not summary:
-                    continue
-                symbol_code = summary.get("symbol_code")
-                if not symbol_code:
-                    continue
-                summary_text = self._symbol_to_text(str(symbol_code))
-                break
-        except Exception:
+                symbol_code = (block.get("summary") or {}).get("symbol_code")
+                if symbol_code:
+                    summary_text = self._symbol_to_text(str(symbol_code))
+                    break
+        except (AttributeError, TypeError):
+            # Malformed summary blocks: keep the default text
             pass
 
-        city_label = label or f"({lat_rounded:.4f}, {lon_rounded:.4f})"
-
-        return WeatherInfo(city=city_label, temperature_c=temp_c, summary=summary_text)
+        forecast = _Forecast(
+            temperature_c=temp_c,
+            summary=summary_text,
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self._cache.set(key, forecast, ttl_seconds)
+        return forecast
 
 
 # -------------------- Geocoding (Nominatim) client --------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class GeoLocation:
     lat: float
     lon: float
     display_name: str
 
 
+def _normalize_query(query: str) -> str:
+    """Normalize a place name for lookups: trim, collapse spaces, casefold."""
+    return " ".join(query.split()).casefold()
+
+
 class GeocodingClient:
     """
     Simple client for OpenStreetMap Nominatim search API.
 
     Docs:
       - https://nominatim.org/release-docs/latest/api/Search/
+
+    Results are cached in memory (30 days by default, up to cache_maxsize
+    queries): a place name maps to the same coordinates, and Nominatim only
+    allows ~1 request per second. Queries that differ only in case or
+    whitespace share one cache entry.
+
+    Requests that do reach Nominatim are sent one at a time, at least
+    min_interval_seconds apart, even when geocode_city is called from
+    several threads (e.g. WeatherService.get_weather_for_cities).
+
+    known_locations can pre-seed places the app looks up all the time, e.g.
+    {"Stockholm, Sweden": GeoLocation(59.3293, 18.0686, "Stockholm")}.
+    Those are answered locally (case- and whitespace-insensitively)
+    without any HTTP request.
+
+    Pass `session` to share one requests.Session (and its connection pool)
+    with other clients; it is then left open by close(), and its headers are
+    not modified (User-Agent/Accept are sent with each request instead).
     """
 
     def __init__(
@@ -174,10 +391,37 @@ class GeocodingClient:
         base_url: str = "https://nominatim.openstreetmap.org/search",
         timeout_seconds: float = 5.0,
         user_agent: str = "my-weather-app/0.1 you@example.com",
+        cache_ttl_seconds: float = 30 * 24 * 3600.0,
+        cache_maxsize: int = 4096,
+        min_interval_seconds: float = 1.0,
+        known_locations: Optional[Mapping[str, GeoLocation]] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         self._base_url = base_url
         self._timeout_seconds = timeout_seconds
-        self._user_agent = user_agent
+        self._owns_session = session is None
+        self._session, self._request_headers = _client_session(session, user_agent)
+        # Query parameters shared by every search request
+        self._base_params = {"format": "jsonv2", "addressdetails": "1"}
+        self._cache = _TTLCache(cache_ttl_seconds, maxsize=cache_maxsize)
+        self._min_interval_seconds = min_interval_seconds
+        self._request_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._known_locations = {
+            _normalize_query(name): location
+            for name, location in (known_locations or {}).items()
+        }
+
+    def close(self) -> None:
+        """Close the HTTP session, unless it was passed in by the caller."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> GeocodingClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def geocode_city(self, query: str, limit: int = 1) -> GeoLocation:
         """
@@ -185,34 +429,55 @@ class GeocodingClient:
           "Stockholm"
           "Stockholm, Sweden"
         """
-        params = {
-            "q": query,
-            "format": "jsonv2",
-            "limit": str(limit),
-            "addressdetails": "1",
-        }
-        headers = {
-            "User-Agent": self._user_agent,
-            "Accept": "application/json",
-        }
+        normalized_query = _normalize_query(query)
+        known = self._known_locations.get(normalized_query)
+        if known is not None:
+            return known
+
+        cache_key = (normalized_query, limit)
+        cached: Optional[GeoLocation] = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        with self._request_lock:
+            # Another thread may have looked this query up while we waited
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            location = self._search(query, limit)
+            self._cache.set(cache_key, location)
+            return location
+
+    def _search(self, query: str, limit: int) -> GeoLocation:
+        """
+        Send one search request, throttled to min_interval_seconds.
+
+        Must be called with self._request_lock held.
+        """
+        delay = self._next_request_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 self._base_url,
-                params=params,
-                headers=headers,
+                params={"q": query, "limit": str(limit), **self._base_params},
+                headers=self._request_headers,
                 timeout=self._timeout_seconds,
             )
         except requests.RequestException as exc:
             raise ApiClientError(f"Geocoding request failed: {exc}") from exc
+        finally:
+            self._next_request_at = time.monotonic() + self._min_interval_seconds
 
         if not response.ok:
             raise ApiClientError(
-                f"Geocoding returned {response.status_code}: {response.text}"
+                f"Geocoding returned {response.status_code}: {_body_snippet(response)}"
             )
 
         try:
-            data: List[Dict[str, Any]] = response.json()
+            data: List[Dict[str, Any]] = _json.loads(response.content)
         except ValueError as exc:
             raise ApiClientError("Geocoding response is not valid JSON") from exc
 
@@ -243,16 +508,38 @@ class WeatherService:
     which:
         1. Geocodes the city with Nominatim.
         2. Fetches weather from MET for the resulting coordinates.
+
+    Clients that are not passed in are created with user_agent and, if
+    given, a shared `session`, so both hosts use one connection pool.
+    Closing the service (or leaving its `with` block) closes both clients;
+    a passed-in session is left open for the caller to close.
     """
 
     def __init__(
         self,
-        weather_client: WeatherClient,
-        geocoding_client: GeocodingClient,
+        weather_client: Optional[WeatherClient] = None,
+        geocoding_client: Optional[GeocodingClient] = None,
+        *,
+        session: Optional[requests.Session] = None,
+        user_agent: str = "my-weather-app/0.1 you@example.com",
     ) -> None:
+        if weather_client is None:
+            weather_client = WeatherClient(user_agent=user_agent, session=session)
+        if geocoding_client is None:
+            geocoding_client = GeocodingClient(user_agent=user_agent, session=session)
         self._weather_client = weather_client
         self._geocoding_client = geocoding_client
 
+    def close(self) -> None:
+        self._weather_client.close()
+        self._geocoding_client.close()
+
+    def __enter__(self) -> WeatherService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def get_weather_for_city(self, city: str) -> WeatherInfo:
         location = self._geocoding_client.geocode_city(city)
         return self._weather_client.get_weather_for_coordinates(
@@ -261,6 +548,34 @@ class WeatherService:
             label=location.display_name,
         )
 
+    def get_weather_for_cities(
+        self,
+        cities: Iterable[str],
+        max_workers: int = 4,
+    ) -> List[WeatherInfo]:
+        """
+        Look up the weather for several cities concurrently.
+
+        Each lookup is I/O bound, so they run on a small thread pool that
+        shares the clients' pooled sessions. Geocoding requests are still
+        throttled by GeocodingClient, so only the MET fetches overlap.
+        Duplicate cities (ignoring case and extra whitespace) are looked up
+        only once. Results are returned in input order; the first failing
+        lookup raises its ApiClientError.
+        """
+        cities = list(cities)
+        keys = [_normalize_query(city) for city in cities]
+        # First spelling of each distinct city, in input order
+        unique: Dict[str, str] = {}
+        for key, city in zip(keys, cities):
+            unique.setdefault(key, city)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(
+                zip(unique, executor.map(self.get_weather_for_city, unique.values()))
+            )
+        return [results[key] for key in keys]
+
 
 def main() -> None:
     """
@@ -274,16 +589,16 @@ def main() -> None:
 
     weather_client = WeatherClient(user_agent=user_agent)
     geocoding_client = GeocodingClient(user_agent=user_agent)
-    service = WeatherService(weather_client, geocoding_client)
 
     city = "Stockholm, Sweden"
 
-    try:
-        info = service.get_weather_for_city(city)
-    except ApiClientError as exc:
-        print(f"Error: {exc}")
-    else:
-        print(f"Weather in {info.city}: {info.temperature_c:.1f}°C, {info.summary}")
+    with WeatherService(weather_client, geocoding_client) as service:
+        try:
+            info = service.get_weather_for_city(city)
+        except ApiClientError as exc:
+            print(f"Error: {exc}")
+        else:
+            print(f"Weather in {info.city}: {info.temperature_c:.1f}°C, {info.summary}")
 
 
 if __name__ == "__main__":
@@ -53,8 +53,17 @@ class WeatherClient:
         user_agent: str = "my-weather-app/0.1 you@example.com",
     ) -> None:
         self._base_url = base_url.rstrip("/")
+        # The forecast endpoint never changes: build its URL once
+        self._forecast_url = f"{self._base_url}/compact"
         self._timeout_seconds = timeout_seconds
-        self._user_agent = user_agent
+        # One Session per client: it keeps connections alive between calls
+        # (like reusing a single HttpClient in C#) and sends these headers
+        # with every request.
+        self._session = requests.Session()
+        self._session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "application/json",
+        })
 
     # ------------------------------------------------------------------
     # Shared HTTP response helper
@@ -132,15 +141,14 @@ class WeatherClient:
 
         High-level steps (this mirrors the full solution file):
 
-        1. Round ``lat`` and ``lon`` to 4 decimals (just to make nicer URLs).
-        2. Build the URL: ``f"{self._base_url}/compact"``.
+        1. Format ``lat`` and ``lon`` with 4 decimals, e.g. ``f"{lat:.4f}"``
+           (just to make nicer URLs).
+        2. The URL is already built in ``__init__``: ``self._forecast_url``.
         3. Build ``params`` dict with ``lat`` and ``lon`` (and optional ``altitude``).
-        4. Build ``headers`` dict with:
-               "User-Agent": self._user_agent
-               "Accept": "application/json"
-        5. Call ``requests.get`` with:
-               url, params=params, headers=headers,
-               timeout=self._timeout_seconds
+        4. (No headers needed: ``self._session`` already sends the
+           "User-Agent" and "Accept" headers.)
+        5. Call ``self._session.get`` with:
+               url, params=params, timeout=self._timeout_seconds
            Wrap ``requests.RequestException`` in ``ApiClientError``.
         6. Call ``self._handle_response(response)`` to get a JSON ``dict``.
         7. From the JSON, extract:
@@ -153,7 +161,7 @@ class WeatherClient:
            If you find one, convert it to text with ``self._symbol_to_text``.
            If not, fall back to something like "No summary available".
         9. Use ``label`` (if provided) as the city label; otherwise use a
-           fallback like "(lat, lon)".
+           fallback like "(59.3293, 18.0686)" built from the formatted strings.
         10. Return a ``WeatherInfo`` instance.
         """
         # TODO: implement this based on the steps above.
@@ -180,7 +188,12 @@ class GeocodingClient:
     ) -> None:
         self._base_url = base_url
         self._timeout_seconds = timeout_seconds
-        self._user_agent = user_agent
+        # See WeatherClient.__init__ for why we keep a Session around.
+        self._session = requests.Session()
+        self._session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "application/json",
+        })
 
     def geocode_city(self, query: str, limit: int = 1) -> GeoLocation:
         """Geocode a city name (optionally with country).
@@ -196,11 +209,10 @@ class GeocodingClient:
                format = "jsonv2"
                limit = str(limit)
                addressdetails = "1"
-        2. Build ``headers`` with:
-               "User-Agent": self._user_agent
-               "Accept": "application/json"
-        3. Call ``requests.get`` with:
-               self._base_url, params=params, headers=headers,
+        2. (No headers needed: ``self._session`` already sends the
+           "User-Agent" and "Accept" headers.)
+        3. Call ``self._session.get`` with:
+               self._base_url, params=params,
                timeout=self._timeout_seconds
            Wrap ``requests.RequestException`` in ``ApiClientError``.
         4. If ``response.ok`` is False, raise ``ApiClientError`` with a
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import Protocol
+from typing import Iterable, Protocol, Sequence
 
 
 class MessageHandler(Protocol):
@@ -17,32 +16,85 @@ class MessageHandler(Protocol):
         ...
 
 
-@dataclass
 class InMemoryQueue:
-    """Very small in-memory queue to simulate queue processing."""
-    messages: list[str]
+    """
+    Very small in-memory queue to simulate queue processing.
+
+    Backed by asyncio.Queue, so several consumers (and producers using put)
+    can share one instance safely.
+    """
+
+    def __init__(self, messages: Iterable[str] = ()) -> None:
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        for message in messages:
+            self._queue.put_nowait(message)
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
 
-    async def receive_batch(self, batch_size: int) -> list[str]:
+    async def put(self, message: str) -> None:
+        """Add a message to the back of the queue."""
+        await self._queue.put(message)
+
+    async def receive_batch(
+        self,
+        batch_size: int,
+        wait_seconds: float = 0.1,
+    ) -> list[str]:
         """
         Pop up to batch_size messages from the queue.
 
-        - Take up to batch_size items from self.messages.
-        - Remove them from the list.
-        - Return them.
-
-        Simulates network I/O with asyncio.sleep.
+        - Wait up to wait_seconds for the first message (like a long poll
+          against a real queue service); return [] if none arrives.
+        - Then take whatever else is already queued, up to batch_size.
+        - Return them in FIFO order.
         """
-        await asyncio.sleep(0.1)
+        if batch_size <= 0:
+            return []
 
-        if batch_size <= 0 or not self.messages:
+        try:
+            batch = [await asyncio.wait_for(self._queue.get(), timeout=wait_seconds)]
+        except asyncio.TimeoutError:
             return []
 
-        batch = self.messages[:batch_size]
-        # Remove the messages we just returned
-        del self.messages[:batch_size]
+        while len(batch) < batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
         return batch
 
 
+# asyncio.TaskGroup is new in 3.11; None means fall back to gather
+_TaskGroup = getattr(asyncio, "TaskGroup", None)
+
+
+async def _process_batch(handler: MessageHandler, batch: Sequence[str]) -> None:
+    """
+    Run the handler for every message in the batch concurrently.
+
+    Uses asyncio.TaskGroup (3.11+) so a failing handler cancels the rest of
+    the batch instead of leaving them running; falls back to gather on 3.10.
+    Either way the first handler exception is raised as-is, not wrapped in
+    an ExceptionGroup; on 3.11+ the group is kept as its __cause__, so any
+    other handler failures stay visible in the traceback.
+
+    Note: on 3.11+ the other messages of a failing batch are cancelled.
+    They have already been taken off the queue, so they never reach the
+    handler (on 3.10, gather lets them run to completion in the background).
+    """
+    if _TaskGroup is None:
+        await asyncio.gather(*(handler(message) for message in batch))
+        return
+
+    try:
+        async with _TaskGroup() as tg:
+            for message in batch:
+                tg.create_task(handler(message))
+    except BaseExceptionGroup as group:  # builtin on 3.11+, like TaskGroup
+        raise group.exceptions[0] from group
+
+
 async def process_queue_forever(
     queue: InMemoryQueue,
     handler: MessageHandler,
@@ -65,8 +117,7 @@ async def process_queue_forever(
                 continue
 
             # Process each message concurrently with the handler
-            tasks = [handler(message) for message in batch]
-            await asyncio.gather(*tasks)
+            await _process_batch(handler, batch)
     except asyncio.CancelledError:
         # allow graceful shutdown
         return
@@ -85,7 +136,7 @@ async def main() -> None:
       - Starts processing in the background.
       - Cancels after a few seconds.
     """
-    queue = InMemoryQueue(messages=[f"msg-{i}" for i in range(10)])
+    queue = InMemoryQueue(f"msg-{i}" for i in range(10))
     task = asyncio.create_task(process_queue_forever(queue, example_handler))
 
     await asyncio.sleep(5)
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from math import fsum
 from pathlib import Path
 from typing import Sequence, List
-import json
+
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
 
 
 def load_values(path: Path) -> List[float]:
@@ -16,8 +24,9 @@ def load_values(path: Path) -> List[float]:
         ...
       ]
     """
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    # Read raw bytes: the parser decodes UTF-8 itself, no str copy needed
+    with path.open("rb") as f:
+        raw = _json.loads(f.read())
 
     if not isinstance(raw, list):
         raise ValueError("Expected top-level JSON array of objects.")
@@ -43,13 +52,16 @@ def calculate_average(values: Sequence[float]) -> float:
     """
     Calculate the arithmetic mean of a sequence of numbers.
 
+    Uses math.fsum, which tracks the rounding error of every addition, so
+    long lists of floats don't drift the way a plain sum() does.
+
     Raises:
         ValueError: if the sequence is empty.
     """
     if not values:
         raise ValueError("Cannot calculate average of empty sequence.")
 
-    return sum(values) / len(values)
+    return fsum(values) / len(values)
 
 
 def main() -> None:
@@ -66,7 +78,8 @@ def main() -> None:
     try:
         values = load_values(metrics_path)
         avg = calculate_average(values)
-    except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError) as exc:
+    # ValueError covers the JSONDecodeError of every supported parser
+    except (FileNotFoundError, KeyError, ValueError) as exc:
         print(f"Failed to calculate metrics: {exc}")
         return
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
-from solution_metrics import calculate_average  # or from solution_metrics import calculate_average
+from solution_metrics import calculate_average, load_values
 
 
 def test_calculate_average_simple() -> None:
@@ -16,3 +18,23 @@ def test_calculate_average_empty_list() -> None:
     """Empty list should raise ValueError."""
     with pytest.raises(ValueError):
         calculate_average([])
+
+
+def test_calculate_average_is_exact_for_repeated_floats() -> None:
+    """Ten times 0.1 should average to exactly 0.1 (plain sum() gives 0.0999...)."""
+    assert calculate_average([0.1] * 10) == 0.1
+
+
+def test_load_values_reads_numbers(tmp_path: Path) -> None:
+    """Every "value" should be returned as a float, in file order."""
+    path = tmp_path / "metrics.json"
+    path.write_text('[{"value": 1}, {"value": 2.5}, {"value": "3"}]', encoding="utf-8")
+    assert load_values(path) == [1.0, 2.5, 3.0]
+
+
+def test_load_values_invalid_json(tmp_path: Path) -> None:
+    """Malformed JSON should raise ValueError (JSONDecodeError is one)."""
+    path = tmp_path / "metrics.json"
+    path.write_text('[{"value": 1},', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_values(path)
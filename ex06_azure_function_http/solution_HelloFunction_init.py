@@ -1,14 +1,58 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import os
+import re
+import time
 
 import azure.functions as func
 
+# orjson if installed, else ujson, else the stdlib; all three are set up to
+# produce the same compact, non-ASCII-escaped UTF-8 bytes
+try:
+    import orjson
 
-def _get_default_name() -> str | None:
-    """Optional helper to read a default name from environment."""
-    return os.getenv("DEFAULT_NAME")
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj: object) -> bytes:
+            text = ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+            return text.encode("utf-8")
+    except ImportError:
+        def _dumps(obj: object) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# ASCII control characters; compiled once per worker. Digits are checked
+# separately with str.isdigit, which also covers "²" and "①" (\d does not).
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+
+# Read once at cold start; app settings changes restart the worker anyway
+_DEFAULT_NAME = os.getenv("DEFAULT_NAME")
+
+# Constant error bodies, encoded once instead of on every rejected request
+_ERR_NO_NAME = _dumps({"error": "Please provide a 'name'."})
+_ERR_DIGITS = _dumps({"error": "Name must not contain digits."})
+_ERR_CONTROL = _dumps({"error": "Name must not contain control characters."})
+
+# (unix second, ISO string) of the last formatted timestamp; swapped as a
+# whole tuple, so concurrent requests never see a mismatched pair
+_last_timestamp: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 (seconds), formatted once per second."""
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, text = _last_timestamp
+    if second != cached_second:
+        text = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _last_timestamp = (second, text)
+    return text
 
 
 def main(req: func.HttpRequest) -> func.HttpResponse:
@@ -35,31 +79,38 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         name = body.get("name")
 
     if not name:
-        name = _get_default_name()
+        name = _DEFAULT_NAME
 
     if not name:
-        error_body = {"error": "Please provide a 'name'."}
         return func.HttpResponse(
-            body=json.dumps(error_body),
+            body=_ERR_NO_NAME,
             status_code=400,
             mimetype="application/json",
         )
 
-    if any(char.isdigit() for char in name):
-        error_body = {"error": "Name must not contain digits."}
+    # str.isdigit, not \d: superscripts and circled digits ("x²", "x①")
+    # count as digits too. map() keeps the scan in C.
+    if any(map(str.isdigit, name)):
+        return func.HttpResponse(
+            body=_ERR_DIGITS,
+            status_code=422,
+            mimetype="application/json",
+        )
+
+    if _CONTROL_CHAR_RE.search(name) is not None:
         return func.HttpResponse(
-            body=json.dumps(error_body),
+            body=_ERR_CONTROL,
             status_code=422,
             mimetype="application/json",
         )
 
     response_data = {
         "greeting": f"Hello {name}!",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utc_timestamp(),
     }
 
     return func.HttpResponse(
-        body=json.dumps(response_data),
+        body=_dumps(response_data),
         status_code=200,
         mimetype="application/json",
     )